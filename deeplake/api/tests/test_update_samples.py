@@ -426,6 +426,32 @@ def test_update_partial(memory_ds, htype, args):
     np.testing.assert_array_equal(arr.reshape(-1), exp.reshape(-1))
 
 
+@pytest.mark.parametrize(
+    "args", [{}, {"sample_compression": "lz4"}, {"chunk_compression": "lz4"}]
+)
+def test_update_keeps_read_samples(memory_ds, args):
+    ds = memory_ds
+    with ds:
+        ds.create_tensor("x", dtype="int64", **args)
+        ds.x.extend([np.array([0, 1, 2]), np.array([3, 4, 5]), np.array([6, 7, 8])])
+    held = ds.x.numpy(aslist=True)
+    held_slice = ds.x[1:2].numpy(aslist=True)
+
+    # same size update
+    ds.x[1] = np.array([100, 101, 102])
+    # different size update
+    ds.x[2] = np.array([9, 9, 9, 9])
+
+    np.testing.assert_array_equal(held[0], [0, 1, 2])
+    np.testing.assert_array_equal(held[1], [3, 4, 5])
+    np.testing.assert_array_equal(held[2], [6, 7, 8])
+    np.testing.assert_array_equal(held_slice[0], [3, 4, 5])
+    assert_array_lists_equal(
+        ds.x.numpy(aslist=True),
+        [np.array([0, 1, 2]), np.array([100, 101, 102]), np.array([9, 9, 9, 9])],
+    )
+
+
 @pytest.mark.slow
 def test_ds_update_image(local_ds, cat_path, dog_path):
     with local_ds as ds:
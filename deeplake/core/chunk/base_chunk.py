@@ -229,7 +229,7 @@ class BaseChunk(DeepLakeMemoryObject):
             self.version,
             self.shapes_encoder.array,
             self.byte_positions_encoder.array,
-            [self.data_bytes],
+            self.data_bytes,
         )
 
     @classmethod
@@ -280,7 +280,8 @@ class BaseChunk(DeepLakeMemoryObject):
         """Copies `self.data_bytes` into a bytearray if it is a memoryview."""
         # data_bytes will be a memoryview if frombuffer is called.
         if isinstance(self.data_bytes, PartialReader):
-            chunk_bytes = self.data_bytes.get_all_bytes()
+            chunk_bytes = memoryview(self.data_bytes.get_all_bytes())
+            # slicing the memoryview avoids an intermediate copy of the chunk's data
             self.data_bytes = bytearray(chunk_bytes[self.header_bytes :])
         elif isinstance(self.data_bytes, memoryview):
             self.data_bytes = bytearray(self.data_bytes)
@@ -521,19 +522,17 @@ class BaseChunk(DeepLakeMemoryObject):
         if not old_data or self.byte_positions_encoder.is_empty():  # tiled sample
             return new_sample_bytes
         old_start_byte, old_end_byte = self.byte_positions_encoder[local_index]
-        left_data = old_data[:old_start_byte]  # type: ignore
-        right_data = old_data[old_end_byte:]  # type: ignore
-
-        # preallocate
-        total_new_bytes = len(left_data) + len(new_sample_bytes) + len(right_data)
-        new_data = bytearray(total_new_bytes)
-
-        # copy old data and add new data
-        new_start_byte = old_start_byte
-        new_end_byte = old_start_byte + len(new_sample_bytes)
-        new_data[:new_start_byte] = left_data
-        new_data[new_start_byte:new_end_byte] = new_sample_bytes
-        new_data[new_end_byte:] = right_data
+
+        # always a fresh buffer, arrays returned by `read_sample` may still be views into the old one
+        # build it in a single allocation, copying both sides through memoryview slices
+        old_view = memoryview(old_data).cast("B")
+        new_sample_view = memoryview(new_sample_bytes).cast("B")
+        new_end_byte = old_start_byte + len(new_sample_view)
+        new_data = bytearray(new_end_byte + len(old_view) - old_end_byte)
+        new_view = memoryview(new_data)
+        new_view[:old_start_byte] = old_view[:old_start_byte]
+        new_view[old_start_byte:new_end_byte] = new_sample_view
+        new_view[new_end_byte:] = old_view[old_end_byte:]
         return new_data
 
     def normalize_shape(self, shape):
@@ -575,9 +574,8 @@ class BaseChunk(DeepLakeMemoryObject):
             shape = self.shapes_encoder._encoded[0][:-1]
             if len(shape) and np.all(shape):
                 if as_bytes:
-                    return b"0" * int(
-                        np.prod(np.array(shape, dtype=np.uint64))
-                        * np.dtype(self.dtype).itemsize
+                    return b"0" * (
+                        reduce(mul, shape.tolist(), 1) * np.dtype(self.dtype).itemsize
                     )
                 return np.zeros(shape, dtype=self.dtype)
         return None
@@ -25,13 +25,12 @@ class ChunkCompressedChunk(BaseChunk):
     def __init__(self, *args, **kwargs):
         super(ChunkCompressedChunk, self).__init__(*args, **kwargs)
         if self.is_byte_compression:
-            self.decompressed_bytes = bytearray(
-                decompress_bytes(self._data_bytes, self.compression)
+            # decompress straight into a mutable buffer instead of copying the bytes into one
+            self.decompressed_bytes = decompress_bytes(
+                self._data_bytes, self.compression, return_bytearray=True
             )
         else:
-            shapes = [
-                self.shapes_encoder[i] for i in range(self.shapes_encoder.num_samples)
-            ]
+            shapes = self.shapes_encoder.all_shapes()
             self.decompressed_samples = decompress_multiple(self._data_bytes, shapes)
         self._changed = False
         self._compression_ratio = 0.5
@@ -58,6 +57,21 @@ class ChunkCompressedChunk(BaseChunk):
             ignore_errors=ignore_errors,
         )
 
+    def _append_decompressed_bytes(self, buffer):
+        """Appends `buffer` to `decompressed_bytes`, growing it in place when possible instead of concatenating into a new buffer."""
+        decompressed_bytes = self.decompressed_bytes
+        if not isinstance(decompressed_bytes, bytearray):
+            # copy into a mutable buffer once, then grow that copy in place
+            ba = bytearray(decompressed_bytes)
+            ba += buffer
+            self.decompressed_bytes = ba
+            return
+        try:
+            decompressed_bytes += buffer
+        except BufferError:
+            # arrays returned by `read_sample` can still be viewing the buffer, which prevents resizing it
+            self.decompressed_bytes = decompressed_bytes + buffer
+
     def extend_if_has_space_byte_compression_text(
         self,
         incoming_samples: List[InputSample],
@@ -110,7 +124,7 @@ class ChunkCompressedChunk(BaseChunk):
                 bts = list(map(self._text_sample_to_byte_string, samples_to_chunk))
                 for i, b in enumerate(bts):
                     lengths[i] = len(b)  # type: ignore
-                self.decompressed_bytes = b"".join([decompressed_bytes, *bts])  # type: ignore
+                self._append_decompressed_bytes(b"".join(bts))
                 del bts
                 self._changed = True
                 break
@@ -168,7 +182,7 @@ class ChunkCompressedChunk(BaseChunk):
                         self.htype,
                     )
             cast = True
-            sample_nbytes = np.dtype(chunk_dtype).itemsize * sample.size
+            sample_nbytes = self.item_size * sample.size
         min_chunk_size = self.min_chunk_size
         decompressed_bytes = self.decompressed_bytes
         while True:
@@ -215,8 +229,8 @@ class ChunkCompressedChunk(BaseChunk):
                 samples_to_chunk = incoming_samples[:num_samples]
                 if cast:
                     samples_to_chunk = samples_to_chunk.astype(chunk_dtype)
-                self.decompressed_bytes = (
-                    decompressed_bytes + samples_to_chunk.tobytes()  # type: ignore
+                self._append_decompressed_bytes(
+                    np.ascontiguousarray(samples_to_chunk).data
                 )
                 self._changed = True
                 break
@@ -264,7 +278,11 @@ class ChunkCompressedChunk(BaseChunk):
                     num_samples += 0.5  # type: ignore
                     tile = serialized_sample.yield_uncompressed_tile()
                     if tile is not None:
-                        self.decompressed_bytes = tile.tobytes()
+                        # copy the tile once, straight into a mutable buffer
+                        tile_bytes = bytearray(tile.nbytes)
+                        tile_view = np.frombuffer(tile_bytes, dtype=tile.dtype)
+                        tile_view.reshape(tile.shape)[...] = tile
+                        self.decompressed_bytes = tile_bytes
                     self._changed = True
                 break
             sample_nbytes = len(serialized_sample)
@@ -294,7 +312,7 @@ class ChunkCompressedChunk(BaseChunk):
                 self._data_bytes = compressed_bytes
                 self._changed = False
             if not recompressed:
-                self.decompressed_bytes += serialized_sample  # type: ignore
+                self._append_decompressed_bytes(serialized_sample)
                 self._changed = True
             self.register_in_meta_and_headers(
                 sample_nbytes, shape, update_tensor_meta=update_tensor_meta
@@ -492,14 +510,10 @@ class ChunkCompressedChunk(BaseChunk):
         decompressed_samples = self.decompressed_samples
 
         decompressed_samples[local_index] = new_sample  # type: ignore
+        # recompressed lazily by `data_bytes`
         self._changed = True
         self.update_in_meta_and_headers(local_index, None, shape)  # type: ignore
 
-        self.data_bytes = bytearray(  # type: ignore
-            compress_multiple(decompressed_samples, self.compression)  # type: ignore
-        )
-        self.update_in_meta_and_headers(local_index, None, shape)
-
     def process_sample_img_compr(self, sample):
         if sample is None:
             if self.tensor_meta.max_shape:
@@ -623,7 +637,9 @@ class ChunkCompressedChunk(BaseChunk):
         )
 
     def prepare_for_write(self):
-        ffw_chunk(self)
+        if not self.write_initialization_done:
+            ffw_chunk(self)
+            self.write_initialization_done = True
         self.is_dirty = True
 
     @property
@@ -41,6 +41,24 @@ def test_read_write_sequence():
         data_in = data_in[num_samples:]
 
 
+def test_read_write_sequence_runs():
+    tensor_meta = create_tensor_meta()
+    common_args["tensor_meta"] = tensor_meta
+    dtype = tensor_meta.dtype
+    data_in = [np.random.rand(10, 10).astype(dtype) for _ in range(5)]
+    data_in += [np.random.rand(3, 7).astype(dtype) for _ in range(3)]
+    data_in += [np.random.rand(10, 10).astype(dtype) for _ in range(2)]
+    chunk = UncompressedChunk(**common_args)
+    num_samples = int(chunk.extend_if_has_space(list(data_in)))
+
+    assert num_samples == 10
+    assert tensor_meta.length == 10
+    assert len(chunk.shapes_encoder._encoded) == 3
+    assert len(chunk.byte_positions_encoder._encoded) == 3
+    for i in range(num_samples):
+        np.testing.assert_array_equal(chunk.read_sample(i), data_in[i])
+
+
 @pytest.mark.slow
 def test_read_write_sequence_big(cat_path):
     tensor_meta = create_tensor_meta()
@@ -147,3 +165,33 @@ def test_update():
             np.testing.assert_array_equal(chunk.read_sample(i), data_5)
         else:
             np.testing.assert_array_equal(chunk.read_sample(i), data_in[i])
+
+
+def test_update_while_sample_is_viewed():
+    tensor_meta = create_tensor_meta()
+    common_args["tensor_meta"] = tensor_meta
+    dtype = tensor_meta.dtype
+    data_in = np.random.rand(4, 10, 10).astype(dtype)
+    chunk = UncompressedChunk(**common_args)
+    chunk.extend_if_has_space(data_in)
+
+    # the returned arrays are views into the chunk's buffer, updates must not write through them
+    view_0 = chunk.read_sample(0)
+    view_2 = chunk.read_sample(2)
+    old_2 = view_2.copy()
+
+    # same size update
+    data_2 = np.random.rand(10, 10).astype(dtype)
+    chunk.update_sample(2, data_2)
+    np.testing.assert_array_equal(view_2, old_2)
+
+    # different size update
+    data_1 = np.random.rand(20, 20).astype(dtype)
+    chunk.update_sample(1, data_1)
+    np.testing.assert_array_equal(view_0, data_in[0])
+    np.testing.assert_array_equal(view_2, old_2)
+
+    np.testing.assert_array_equal(chunk.read_sample(1), data_1)
+    np.testing.assert_array_equal(chunk.read_sample(2), data_2)
+    for i in (0, 3):
+        np.testing.assert_array_equal(chunk.read_sample(i), data_in[i])
@@ -157,42 +157,68 @@ class UncompressedChunk(BaseChunk):
         num_samples: float = 0
         skipped: List[int] = []
 
-        for i, incoming_sample in enumerate(incoming_samples):
-            try:
-                serialized_sample, shape = self.serialize_sample(incoming_sample)
-                if shape is not None and not self.tensor_meta.is_link:
-                    self.num_dims = self.num_dims or len(shape)
-                    check_sample_shape(shape, self.num_dims)
-            except Exception as e:
-                if ignore_errors:
-                    skipped.append(i)
-                    continue
-                raise
+        # consecutive samples with the same size and shape are registered as a single run
+        run_nbytes: Optional[int] = None
+        run_shape = None
+        run_length = 0
 
-            # NOTE re-chunking logic should not reach to this point, for Tiled ones we do not have this logic
-            if isinstance(serialized_sample, SampleTiles):
-                incoming_samples[i] = serialized_sample  # type: ignore
-                if self.is_empty:
-                    self.write_tile(serialized_sample)
-                    num_samples += 0.5
-                break
-            else:
-                sample_nbytes = len(serialized_sample)
-                if self.is_empty or self.can_fit_sample(sample_nbytes):
-                    self._data_bytes += serialized_sample  # type: ignore
+        def register_run():
+            if run_length:
+                self.register_in_meta_and_headers(
+                    run_nbytes,
+                    run_shape,
+                    update_tensor_meta=update_tensor_meta,
+                    num_samples=run_length,
+                )
 
-                    self.register_in_meta_and_headers(
-                        sample_nbytes,
-                        shape,
-                        update_tensor_meta=update_tensor_meta,
-                    )
-                    if isinstance(incoming_sample, LinkedTiledSample):
-                        num_samples += 0.5
-                        break
+        try:
+            for i, incoming_sample in enumerate(incoming_samples):
+                try:
+                    serialized_sample, shape = self.serialize_sample(incoming_sample)
+                    if shape is not None and not self.tensor_meta.is_link:
+                        self.num_dims = self.num_dims or len(shape)
+                        check_sample_shape(shape, self.num_dims)
+                except Exception as e:
+                    if ignore_errors:
+                        skipped.append(i)
+                        continue
+                    raise
 
-                    num_samples += 1
-                else:
+                # NOTE re-chunking logic should not reach to this point, for Tiled ones we do not have this logic
+                if isinstance(serialized_sample, SampleTiles):
+                    incoming_samples[i] = serialized_sample  # type: ignore
+                    if self.is_empty:
+                        self.write_tile(serialized_sample)
+                        num_samples += 0.5
                     break
+                else:
+                    sample_nbytes = len(serialized_sample)
+                    if self.is_empty or self.can_fit_sample(sample_nbytes):
+                        self._data_bytes += serialized_sample  # type: ignore
+
+                        if (
+                            run_length
+                            and sample_nbytes == run_nbytes
+                            and shape == run_shape
+                        ):
+                            run_length += 1
+                        else:
+                            register_run()
+                            run_nbytes, run_shape, run_length = sample_nbytes, shape, 1
+                        if not sample_nbytes:
+                            # empty samples leave the data untouched, register them right away so `is_empty` stays accurate
+                            register_run()
+                            run_length = 0
+
+                        if isinstance(incoming_sample, LinkedTiledSample):
+                            num_samples += 0.5
+                            break
+
+                        num_samples += 1
+                    else:
+                        break
+        finally:
+            register_run()
 
         for i in reversed(skipped):
             incoming_samples.pop(i)
@@ -112,7 +112,8 @@ from deeplake.core.sample import Sample
 from itertools import chain, repeat
 from collections.abc import Iterable
 from PIL import Image  # type: ignore
-from functools import partial
+from functools import partial, reduce
+from operator import mul
 from concurrent import futures
 from concurrent.futures import ThreadPoolExecutor
 from deeplake.core.storage.lru_cache import _get_nbytes
@@ -273,7 +274,7 @@ class ChunkEngine:
                 and tensor_meta.htype not in ["text", "json", "list", "polygon", "tag"]
                 and tensor_meta.max_shape
                 and (tensor_meta.max_shape == tensor_meta.min_shape)
-                and (np.prod(tensor_meta.max_shape) < 20)
+                and (reduce(mul, tensor_meta.max_shape, 1) < 20)
             )
         return False
 
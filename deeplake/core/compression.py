@@ -144,17 +144,19 @@ def compress_bytes(
 
 
 def decompress_bytes(
-    buffer: Union[bytes, memoryview], compression: Optional[str]
-) -> bytes:
+    buffer: Union[bytes, memoryview],
+    compression: Optional[str],
+    return_bytearray: bool = False,
+) -> Union[bytes, bytearray]:
     if not buffer:
-        return b""
+        return bytearray() if return_bytearray else b""
     if compression == "lz4":
         # weird edge case of lz4 + empty string
         if buffer == b"\x00\x00\x00\x00\x00":
-            return b""
+            return bytearray() if return_bytearray else b""
         if buffer[:4] == b'\x04"M\x18':  # python-lz4 magic number
-            return lz4.frame.decompress(buffer)
-        return lz4.block.decompress(buffer)
+            return lz4.frame.decompress(buffer, return_bytearray=return_bytearray)
+        return lz4.block.decompress(buffer, return_bytearray=return_bytearray)
     else:
         raise SampleDecompressionError()
 
@@ -414,7 +416,7 @@ def decompress_multiple(
     canvas = decompress_array(buffer)
     arrays = []
     next_x = 0
-    for shape in shapes:
+    for shape in map(tuple, np.asarray(shapes).tolist()):
         if shape == (0, 0, 0):
             arrays.append(np.zeros(shape, dtype=canvas.dtype))
         else:
@@ -54,6 +54,9 @@ def ffw(func):
 
     def decor(inp, **kwargs):
         v = inp.version
+        if v == deeplake.__version__:
+            # already up to date, skip parsing and comparing the version strings
+            return
         if not _check_version(v):
             out = func(inp, v, **kwargs)
             inp.version = deeplake.__version__
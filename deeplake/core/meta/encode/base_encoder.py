@@ -318,7 +318,9 @@ class Encoder(ABC):
                 f"Update could not be executed for idx={local_sample_index}, item={str(item)}"
             )
 
-        self._post_process_state(start_row_index=max(row_index - 2, 0))
+        if action_taken != self._try_not_changing:
+            # nothing moved when the item is unchanged, so derived columns are still valid
+            self._post_process_state(start_row_index=max(row_index - 2, 0))
         self._reset_update_state()
         self.is_dirty = True
 
@@ -65,12 +65,23 @@ class BytePositionsEncoder(Encoder):
         """Starting at `start_row_index`, move downwards through `self._encoded` and update all start bytes
         for each row if applicable. Used for updating."""
 
-        for row_index in range(start_row_index, len(self._encoded)):
-            if row_index == 0:
-                bytes_under_row = 0
-            else:
-                bytes_under_row = self.get_sum_of_bytes(row_index - 1)
-            self._encoded[row_index, START_BYTE_COLUMN] = bytes_under_row
+        encoded = self._encoded
+        if start_row_index >= len(encoded):
+            return
+        if start_row_index == 0:
+            bytes_under_row = 0
+            prev_last_index = -1
+        else:
+            bytes_under_row = self.get_sum_of_bytes(start_row_index - 1)
+            prev_last_index = int(encoded[start_row_index - 1, LAST_SEEN_INDEX_COLUMN])
+
+        rows = encoded[start_row_index:]
+        num_samples = np.diff(
+            rows[:, LAST_SEEN_INDEX_COLUMN].astype(np.int64), prepend=prev_last_index
+        )
+        row_nbytes = rows[:, NUM_BYTES_COLUMN] * num_samples.astype(encoded.dtype)
+        rows[0, START_BYTE_COLUMN] = bytes_under_row
+        rows[1:, START_BYTE_COLUMN] = bytes_under_row + np.cumsum(row_nbytes[:-1])
 
     def _derive_value(self, row: np.ndarray, row_index: int, local_sample_index: int):
         index_bias = 0
@@ -1,3 +1,4 @@
+from functools import lru_cache
 from typing import Any, List, Tuple, Optional
 from deeplake.core.meta.encode.base_encoder import Encoder, LAST_SEEN_INDEX_COLUMN
 from deeplake.constants import ENCODING_DTYPE
@@ -14,9 +15,28 @@ from deeplake.util.generate_id import generate_id
 CHUNK_ID_COLUMN = 0
 
 
+@lru_cache()
+def _max_value(dtype) -> int:
+    return int(np.iinfo(dtype).max)
+
+
 class ChunkIdEncoder(Encoder, DeepLakeMemoryObject):
     def __init__(self, encoded=None, dtype=ENCODING_DTYPE):
         super().__init__(encoded, dtype)
+        # rows are appended into a buffer that grows geometrically, `_encoded` is a view of its live rows
+        self._buffer = None
+
+    def _append_row(self, chunk_id, last_index):
+        encoded = self._encoded
+        buffer = self._buffer
+        length = len(encoded)
+        if buffer is None or encoded.base is not buffer or length == len(buffer):
+            # `_encoded` was replaced by a new array, or the buffer is full
+            buffer = np.empty((max(2 * length, 8), 2), dtype=encoded.dtype)
+            buffer[:length] = encoded
+            self._buffer = buffer
+        buffer[length] = chunk_id, last_index
+        self._encoded = buffer[: length + 1]
 
     @staticmethod
     def name_from_id(id) -> str:
@@ -131,12 +151,7 @@ class ChunkIdEncoder(Encoder, DeepLakeMemoryObject):
                 if row is not None and row != self.num_chunks:
                     raise OutOfChunkCountError()
                 last_index = self.num_samples - 1
-
-                new_entry = np.array(
-                    [[chunk_id, last_index]],
-                    dtype=self.dtype,
-                )
-                self._encoded = np.concatenate([self._encoded, new_entry])
+                self._append_row(chunk_id, last_index)
         return chunk_id
 
     def register_samples(self, num_samples: int, row: Optional[int] = None):  # type: ignore
@@ -215,12 +230,9 @@ class ChunkIdEncoder(Encoder, DeepLakeMemoryObject):
         # note: do not call super() method (num_samples can be 0)
 
     def _derive_next_last_index(self, last_index, num_samples: int):
-        # this operation will trigger an overflow for the first addition, so supress the warning
-        np.seterr(over="ignore")
-        new_last_index = last_index + self.dtype(num_samples)
-        np.seterr(over="warn")
-
-        return new_last_index
+        # the first addition overflows from the -1 placeholder, so wrap explicitly on python ints
+        # instead of toggling numpy's global error state
+        return self.dtype((int(last_index) + int(num_samples)) & _max_value(self.dtype))
 
     def _combine_condition(self, *args) -> bool:
         """Always returns True because sample registration can always be done. Used in base encoder `register_samples`."""
@@ -247,42 +259,54 @@ class ChunkIdEncoder(Encoder, DeepLakeMemoryObject):
 
         Returns:
             Any: Either just a singular derived value, or a tuple with the derived value and the row index respectively.
+
+        Raises:
+            IndexError: If `local_sample_index` is out of bounds.
         """
         if local_sample_index < 0:
             local_sample_index += self.num_samples
 
         row_index = self.translate_index(local_sample_index)
-        output: List[Any] = []
-        value = self._derive_value(
-            self._encoded[row_index], row_index, local_sample_index
+        encoded = self._encoded
+        if row_index >= len(encoded):
+            raise IndexError(
+                f"Index {local_sample_index} is out of bounds for {self.num_samples} samples."
+            )
+        end = row_index + 1
+        if (
+            end == len(encoded)
+            or encoded[end, LAST_SEEN_INDEX_COLUMN] != local_sample_index
+        ):
+            # the sample is in a single chunk
+            chunk_id = encoded[row_index, CHUNK_ID_COLUMN]
+            return [(chunk_id, row_index)] if return_row_index else [chunk_id]
+
+        # tiled sample, every following row that ends at this index holds one of its chunks
+        end = int(
+            np.searchsorted(
+                encoded[:, LAST_SEEN_INDEX_COLUMN], local_sample_index, "right"
+            )
         )
+        self.last_row = end - 1
+        chunk_ids = encoded[row_index:end, CHUNK_ID_COLUMN]
         if return_row_index:
-            output.append((value, row_index))
-        else:
-            output.append(value)
-
-        row_index += 1
-
-        while row_index < len(self._encoded):
-            if self._encoded[row_index][LAST_SEEN_INDEX_COLUMN] == local_sample_index:
-                self.last_row = row_index
-                value = self._derive_value(
-                    self._encoded[row_index], row_index, local_sample_index
-                )
-                if return_row_index:
-                    output.append((value, row_index))
-                else:
-                    output.append(value)
-                row_index += 1
-            else:
-                break
-        return output
+            return [
+                (chunk_id, row) for row, chunk_id in enumerate(chunk_ids, row_index)
+            ]
+        return list(chunk_ids)
 
     def _num_samples_in_last_chunk(self):
         return self._num_samples_in_last_row()
 
     def _delete_rows(self, rows: List[int]):
         if rows:
+            num_rows = len(rows)
+            length = len(self._encoded)
+            if rows == list(range(length - num_rows, length)):
+                # trailing rows, dropping them only shrinks the live part of the buffer
+                self._encoded = self._encoded[: length - num_rows]
+                self.is_dirty = True
+                return True
             for row in rows:
                 prev = (
                     -1 if row == 0 else self._encoded[row - 1][LAST_SEEN_INDEX_COLUMN]
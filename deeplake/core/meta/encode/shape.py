@@ -18,3 +18,16 @@ class ShapeEncoder(Encoder):
     ) -> bool:
         last_shape = self._derive_value(self._encoded[compare_row_index])
         return shape == last_shape
+
+    def all_shapes(self) -> np.ndarray:
+        """Decodes the shapes of all samples at once, without going through `__getitem__` for every index.
+
+        Returns:
+            np.ndarray: Array of shape `(num_samples, dimensionality)` where row `i` is the shape of sample `i`.
+        """
+        encoded = self._encoded
+        if len(encoded) == 0:
+            return np.zeros((0, 0), dtype=ENCODING_DTYPE)
+        last_seen = encoded[:, LAST_SEEN_INDEX_COLUMN].astype(np.int64)
+        counts = np.diff(last_seen, prepend=-1)
+        return np.repeat(encoded[:, :LAST_SEEN_INDEX_COLUMN], counts, axis=0)
@@ -87,3 +87,71 @@ def test_ids():
     out_id = ChunkIdEncoder.id_from_name(name)
 
     assert id == out_id
+
+
+def test_many_chunks():
+    enc = ChunkIdEncoder()
+    ids = []
+    for _ in range(100):
+        ids.append(enc.generate_chunk_id())
+        enc.register_samples(2)
+
+    assert enc.num_chunks == 100
+    assert enc.num_samples == 200
+    assert [enc[2 * i][0] for i in range(100)] == ids
+
+    restored = ChunkIdEncoder.frombuffer(bytes(enc.tobytes()))
+    assert restored.num_chunks == 100
+    assert (restored._encoded == enc._encoded).all()
+
+    # appending after `_encoded` was replaced by a deserialized array
+    new_id = restored.generate_chunk_id()
+    restored.register_samples(2)
+    assert restored.num_chunks == 101
+    assert restored[200][0] == new_id
+    assert (restored._encoded[:100] == enc._encoded).all()
+
+
+def test_tiled_sample():
+    enc = ChunkIdEncoder()
+    id1 = enc.generate_chunk_id()
+    enc.register_samples(2)
+
+    # sample 2 is split across 3 chunks
+    tile_ids = [enc.generate_chunk_id()]
+    enc.register_samples(1)
+    for _ in range(2):
+        tile_ids.append(enc.generate_chunk_id())
+        enc.register_samples(0)
+
+    id2 = enc.generate_chunk_id()
+    enc.register_samples(3)
+
+    assert enc[1] == [id1]
+    assert enc[2] == tile_ids
+    assert enc.__getitem__(2, return_row_index=True) == list(zip(tile_ids, [1, 2, 3]))
+    assert enc[3] == [id2]
+    assert enc[5] == [id2]
+    with pytest.raises(IndexError):
+        enc[6]
+
+
+def test_pop_trailing_rows():
+    enc = ChunkIdEncoder()
+    id1 = enc.generate_chunk_id()
+    enc.register_samples(2)
+    enc.generate_chunk_id()
+    enc.register_samples(1)
+    enc.generate_chunk_id()
+    enc.register_samples(0)
+
+    _, rows, to_delete = enc.pop()
+    assert rows == [1, 2]
+    assert to_delete
+    assert enc.num_chunks == 1
+    assert enc.num_samples == 2
+
+    id2 = enc.generate_chunk_id()
+    enc.register_samples(1)
+    assert enc[1] == [id1]
+    assert enc[2] == [id2]
@@ -150,3 +150,18 @@ def test_failures():
         enc[101] = (1, 1)
 
     assert enc.num_samples == 100
+
+
+def test_all_shapes():
+    enc = ShapeEncoder()
+    assert enc.all_shapes().shape[0] == 0
+
+    enc.register_samples((10, 10, 15), 5)
+    enc.register_samples((10, 20, 30), 10)
+    enc[5] = (10, 11, 12)
+    enc.register_samples((1, 2, 3), 1)
+
+    shapes = enc.all_shapes()
+    assert shapes.shape == (enc.num_samples, 3)
+    for i in range(enc.num_samples):
+        assert tuple(shapes[i]) == enc[i]
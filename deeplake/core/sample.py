@@ -378,13 +378,15 @@ class Sample:
                     shape=self.shape,
                     dtype=self.dtype,
                 )
-                self._uncompressed_bytes = self._array.tobytes()
                 self._typestr = self._array.__array_interface__["typestr"]
                 self._dtype = np.dtype(self._typestr).name
 
     def uncompressed_bytes(self) -> Optional[bytes]:
         """Returns uncompressed bytes."""
         self._decompress()
+        if self._uncompressed_bytes is None and isinstance(self._array, np.ndarray):
+            # only copied out when requested, reading `array` alone shouldn't pay for it
+            self._uncompressed_bytes = self._array.tobytes()
         return self._uncompressed_bytes
 
     @property
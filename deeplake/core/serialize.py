@@ -47,7 +47,9 @@ def infer_chunk_num_bytes(
     version: str,
     shape_info: np.ndarray,
     byte_positions: np.ndarray,
-    data: Optional[Union[Sequence[bytes], Sequence[memoryview]]] = None,
+    data: Optional[
+        Union[bytes, bytearray, memoryview, Sequence[bytes], Sequence[memoryview]]
+    ] = None,
     len_data: Optional[int] = None,
 ) -> int:
     """Calculates the number of bytes in a chunk without serializing it. Used by `LRUCache` to determine if a chunk can be cached.
@@ -56,7 +58,7 @@ def infer_chunk_num_bytes(
         version: (str) Version of deeplake library
         shape_info: (numpy.ndarray) Encoded shapes info from the chunk's `ShapeEncoder` instance.
         byte_positions: (numpy.ndarray) Encoded byte positions from the chunk's `BytePositionsEncoder` instance.
-        data: (list) `_data` field of the chunk
+        data: (bytes, list) `_data` field of the chunk, either a single buffer or a list of buffers
         len_data: (int, optional) Number of bytes in the chunk
 
     Returns:
@@ -65,7 +67,10 @@ def infer_chunk_num_bytes(
     # NOTE: Assumption: version string contains ascii characters only (ord(c) < 128)
     # NOTE: Assumption: len(version) < 256
     if len_data is None:
-        len_data = sum(map(len, data))  # type: ignore
+        if isinstance(data, (bytes, bytearray, memoryview)):
+            len_data = len(data)
+        else:
+            len_data = sum(map(len, data))  # type: ignore
 
     header_size = infer_header_num_bytes(version, shape_info, byte_positions)
     return header_size + len_data
@@ -75,7 +80,7 @@ def serialize_chunk(
     version: str,
     shape_info: np.ndarray,
     byte_positions: np.ndarray,
-    data: Union[Sequence[bytes], Sequence[memoryview]],
+    data: Union[bytes, bytearray, memoryview, Sequence[bytes], Sequence[memoryview]],
     len_data: Optional[int] = None,
 ) -> memoryview:
     """Serializes a chunk's headers and data into a single byte stream. This is how the chunk will be written to the storage provider.
@@ -84,7 +89,7 @@ def serialize_chunk(
         version: (str) Version of deeplake library.
         shape_info: (numpy.ndarray) Encoded shapes info from the chunk's `ShapeEncoder` instance.
         byte_positions: (numpy.ndarray) Encoded byte positions from the chunk's `BytePositionsEncoder` instance.
-        data: (list) `_data` field of the chunk.
+        data: (bytes, list) `_data` field of the chunk, either a single buffer or a list of buffers.
         len_data: (int, optional) Number of bytes in the chunk.
 
     Returns:
@@ -108,6 +113,13 @@ def write_version(version, buffer) -> int:
     return offset
 
 
+def write_array(arr: np.ndarray, buffer, offset) -> int:
+    """Copies `arr` into the buffer through a numpy view over it, without an intermediate `tobytes` copy. Returns updated offset."""
+    view = np.frombuffer(buffer, dtype=arr.dtype, count=arr.size, offset=offset)
+    view[:] = arr.reshape(-1)
+    return offset + arr.nbytes
+
+
 def write_shape_info(shape_info, buffer, offset) -> int:
     """Writes shape info to the buffer, takes offset into account and returns updated offset."""
     if shape_info.ndim == 1:
@@ -116,8 +128,7 @@ def write_shape_info(shape_info, buffer, offset) -> int:
         buffer[offset : offset + 8] = struct.pack("<ii", *shape_info.shape)
         offset += 8
 
-        buffer[offset : offset + shape_info.nbytes] = shape_info.tobytes()
-        offset += shape_info.nbytes
+        offset = write_array(shape_info, buffer, offset)
     return offset
 
 
@@ -129,13 +140,16 @@ def write_byte_positions(byte_positions, buffer, offset) -> int:
         buffer[offset : offset + 4] = byte_positions.shape[0].to_bytes(4, "little")
         offset += 4
 
-        buffer[offset : offset + byte_positions.nbytes] = byte_positions.tobytes()
-        offset += byte_positions.nbytes
+        offset = write_array(byte_positions, buffer, offset)
     return offset
 
 
 def write_actual_data(data, buffer, offset) -> int:
     """Writes actual chunk data to the buffer, takes offset into account and returns updated offset"""
+    if isinstance(data, (bytes, bytearray, memoryview)):
+        n = len(data)
+        buffer[offset : offset + n] = data
+        return offset + n
     for byts in data:
         n = len(byts)
         buffer[offset : offset + n] = byts
@@ -242,7 +256,12 @@ def deserialize_chunk(
         shape_info = np.array([], dtype=enc_dtype)
     else:
         shape_info = (
-            np.frombuffer(byts[offset : offset + shape_info_nbytes], dtype=enc_dtype)
+            np.frombuffer(
+                byts,
+                dtype=enc_dtype,
+                count=shape_info_nbytes // itemsize,
+                offset=offset,
+            )
             .reshape(shape_info_nrows, shape_info_ncols)
             .copy()
         )
@@ -257,7 +276,10 @@ def deserialize_chunk(
     else:
         byte_positions = (
             np.frombuffer(
-                byts[offset : offset + byte_positions_nbytes], dtype=enc_dtype
+                byts,
+                dtype=enc_dtype,
+                count=byte_positions_nbytes // itemsize,
+                offset=offset,
             )
             .reshape(byte_positions_rows, 3)
             .copy()
@@ -368,8 +390,7 @@ def serialize_chunkids(version: str, arr: np.ndarray) -> memoryview:
         offset += 1
 
     # Write ids
-    flatbuff[offset : offset + arr.nbytes] = arr.tobytes()
-    offset += arr.nbytes
+    offset = write_array(arr, flatbuff, offset)
     return memoryview(flatbuff)
 
 
@@ -3,9 +3,13 @@ import posixpath
 import pickle
 import json
 import os
-import tempfile
+import threading
 import time
-from typing import Dict, Optional, Tuple, Union
+from collections import OrderedDict
+from itertools import islice
+from typing import Any, Dict, Hashable, Optional, Set, Tuple, Union
+from concurrent import futures
+from concurrent.futures import ThreadPoolExecutor
 
 from deeplake.util.path import relpath
 
@@ -18,6 +22,56 @@ from deeplake.util.exceptions import (
 )
 from deeplake.client.client import DeepLakeBackendClient
 
+try:
+    from google.oauth2 import service_account  # type: ignore
+except ImportError:
+    service_account = None  # type: ignore
+
+
+# partial response mask for listings that only need the blob names
+_LIST_NAMES_FIELDS = "items(name),nextPageToken"
+
+# number of blobs requested per listing page
+_LIST_PAGE_SIZE = 1000
+
+# number of deletes sent together in a single batch request
+_DELETE_BATCH_SIZE = 100
+
+# size of the http connection pool shared by concurrent requests
+_MAX_POOL_CONNECTIONS = 64
+
+# default number of concurrent uploads in set_items, kept below the connection pool size
+_MAX_UPLOAD_WORKERS = 32
+
+
+# storage.Client is thread safe, so providers created with the same credentials in the same process share one
+# client (and its authorized session and connection pool) instead of bootstrapping a new one each time.
+# Only the most recently used clients are kept, so distinct tokens don't keep their sessions alive forever.
+_MAX_CACHED_CLIENTS = 8
+_CLIENT_CACHE: "OrderedDict[Tuple, Tuple[GCloudCredentials, Any]]" = OrderedDict()
+_CLIENT_CACHE_LOCK = threading.Lock()
+
+
+def _token_key(token) -> Hashable:
+    if isinstance(token, dict):
+        return json.dumps(token, sort_keys=True)
+    if token is None or isinstance(token, str):
+        return token
+    # credentials objects are kept alive while their client is cached, so the id can't be reused by another object
+    # with an entry in the cache
+    return id(token)
+
+
+def _mount_connection_pool(client):
+    """Enlarges the connection pool of the client session, so that concurrent requests made by
+    ``GCSProvider.get_items`` reuse connections instead of opening new ones."""
+    from requests.adapters import HTTPAdapter  # type: ignore
+
+    adapter = HTTPAdapter(
+        pool_connections=_MAX_POOL_CONNECTIONS, pool_maxsize=_MAX_POOL_CONNECTIONS
+    )
+    client._http.mount("https://", adapter)
+
 
 def _remove_protocol_from_path(path: str) -> str:
     return path.replace("gcp://", "").replace("gcs://", "").replace("gs://", "")
@@ -71,22 +125,6 @@ class GCloudCredentials:
         if credentials:
             self.credentials = credentials
 
-    def _dict_to_credentials(self, token: Dict):
-        """
-        Convert dict-style token.
-        Does not preserve access token itself, assumes refresh required.
-
-        Args:
-            token (Dict): dictionary with token to be stored in .json file.
-
-        Returns:
-            Path to stored .json file.
-        """
-        token_file = tempfile.NamedTemporaryFile(suffix=".json", delete=False)
-        with open(token_file.name, "w") as f:
-            json.dump(token, f)
-        return token_file.name
-
     def _connect_token(self, token: Optional[Union[str, Dict]] = None):
         """
         Connect using a concrete token.
@@ -111,8 +149,7 @@ class GCloudCredentials:
             except:
                 token = json.load(open(token))
         if isinstance(token, dict):
-            token = self._dict_to_credentials(token)
-            self._connect_service(token)
+            self._connect_service_info(token)
             return
         elif isinstance(token, google.auth.credentials.Credentials):
             credentials = token
@@ -121,13 +158,18 @@ class GCloudCredentials:
         self.credentials = credentials
 
     def _connect_service(self, fn):
-        from google.oauth2 import service_account  # type: ignore
-
         credentials = service_account.Credentials.from_service_account_file(
             fn, scopes=[self.scope]
         )
         self.credentials = credentials
 
+    def _connect_service_info(self, info: Dict):
+        """Load service account credentials from an in-memory token, without going through a file."""
+        credentials = service_account.Credentials.from_service_account_info(
+            info, scopes=[self.scope]
+        )
+        self.credentials = credentials
+
     def _connect_browser(self):
         """Create and store new credentials using OAuth authentication method.
             Requires having default client configuration file in ~/.config/gcloud/application_default_credentials.json
@@ -291,22 +333,41 @@ class GCSProvider(StorageProvider):
         sd.read_only = read_only
         return sd
 
-    def _initialize_provider(self):
+    def _initialize_provider(self) -> None:
         from google.cloud import storage  # type: ignore
         from google.api_core import retry  # type: ignore
 
         self._set_bucket_and_path()
         if not self.token:
             self.token = None
-        self.scoped_credentials = GCloudCredentials(self.token, project=self.project)
         self.retry = retry.Retry(deadline=60)
-        self.client = storage.Client(credentials=self.scoped_credentials.credentials)
+        client_key = (os.getpid(), _token_key(self.token), self.project)
+        with _CLIENT_CACHE_LOCK:
+            cached = _CLIENT_CACHE.get(client_key)
+            if cached is not None:
+                _CLIENT_CACHE.move_to_end(client_key)
+        if cached is None:
+            # authenticating may need the network or user input, so it is done without holding the lock
+            scoped_credentials = GCloudCredentials(self.token, project=self.project)
+            client = storage.Client(credentials=scoped_credentials.credentials)
+            _mount_connection_pool(client)
+            with _CLIENT_CACHE_LOCK:
+                # another provider may have cached a client for the same key in the meantime
+                cached = _CLIENT_CACHE.setdefault(
+                    client_key, (scoped_credentials, client)
+                )
+                _CLIENT_CACHE.move_to_end(client_key)
+                while len(_CLIENT_CACHE) > _MAX_CACHED_CLIENTS:
+                    _CLIENT_CACHE.popitem(last=False)
+        self.scoped_credentials, self.client = cached
         self._client_bucket = None
+        self._keys_cache: Optional[Set[str]] = None
 
     @property
     def client_bucket(self):
         if self._client_bucket is None:
-            self._client_bucket = self.client.get_bucket(self.bucket)
+            # bucket() doesn't fetch the bucket metadata, a missing bucket surfaces on the first request instead
+            self._client_bucket = self.client.bucket(self.bucket)
         return self._client_bucket
 
     def _set_bucket_and_path(self):
@@ -321,11 +382,26 @@ class GCSProvider(StorageProvider):
             self.path += "/"
 
     def _get_path_from_key(self, key):
-        return posixpath.join(self.path, key)
+        # self.path always ends with "/", see _set_bucket_and_path and rename
+        return self.path + key
+
+    def _all_keys(self) -> Set[str]:
+        """Lists all the objects present under the root of the provider.
+
+        Always lists the bucket, objects may have been written or deleted by other providers or processes.
 
-    def _all_keys(self):
-        self._blob_objects = self.client_bucket.list_blobs(prefix=self.path)
-        return {posixpath.relpath(obj.name, self.path) for obj in self._blob_objects}
+        Returns:
+            set: set of all the objects found under the root.
+        """
+        return set(self._keys_iterator())
+
+    def _keys_iterator(self):
+        """Streams the keys under the root of the provider, one listing page at a time."""
+        blob_objects = self.client_bucket.list_blobs(
+            prefix=self.path, page_size=_LIST_PAGE_SIZE, fields=_LIST_NAMES_FIELDS
+        )
+        for blob in blob_objects:
+            yield posixpath.relpath(blob.name, self.path)
 
     def _set_hub_creds_info(
         self,
@@ -356,11 +432,19 @@ class GCSProvider(StorageProvider):
             Exercise caution!
         """
         self.check_readonly()
+        self._keys_cache = None
         path = posixpath.join(self.path, prefix) if prefix else self.path
-        blob_objects = self.client_bucket.list_blobs(prefix=path)
-        for blob in blob_objects:
+        blob_objects = self.client_bucket.list_blobs(
+            prefix=path, fields=_LIST_NAMES_FIELDS
+        )
+        while True:
+            blobs = list(islice(blob_objects, _DELETE_BATCH_SIZE))
+            if not blobs:
+                break
             try:
-                blob.delete()
+                with self.client.batch():
+                    for blob in blobs:
+                        blob.delete()
             except Exception:
                 pass
 
@@ -383,6 +467,7 @@ class GCSProvider(StorageProvider):
         self.path = new_path
         if not self.path.endswith("/"):
             self.path += "/"
+        self._keys_cache = None
 
     def __getitem__(self, key):
         """Retrieve data."""
@@ -409,7 +494,8 @@ class GCSProvider(StorageProvider):
             KeyError: If an object is not found at the path.
         """
         try:
-            blob = self.client_bucket.get_blob(self._get_path_from_key(path))
+            # the download itself raises NotFound for missing blobs, no need for a metadata request first
+            blob = self.client_bucket.blob(self._get_path_from_key(path))
             if end_byte is not None:
                 end_byte -= 1
             return blob.download_as_bytes(
@@ -422,19 +508,31 @@ class GCSProvider(StorageProvider):
         """Store value in key."""
         self.check_readonly()
         blob = self.client_bucket.blob(self._get_path_from_key(key))
+        # upload_from_string only accepts str / bytes, so buffers have to be copied once here
         if isinstance(value, memoryview):
             value = value.tobytes()
         elif isinstance(value, bytearray):
             value = bytes(value)
         blob.upload_from_string(value, retry=self.retry)
+        if self._keys_cache is not None:
+            self._keys_cache.add(key)
 
     def __iter__(self):
         """Iterating over the structure."""
-        yield from [f for f in self._all_keys() if not f.endswith("/")]
+        # reuses the keys listed by a directly preceding `len`, only once, so that later iterations list again
+        keys = self._keys_cache
+        self._keys_cache = None
+        if keys is None:
+            keys = self._keys_iterator()
+        for key in keys:
+            if not key.endswith("/"):
+                yield key
 
     def __len__(self):
         """Returns length of the structure."""
-        return len(self._all_keys())
+        # kept for the iteration that usually follows, writes and deletes through this provider keep it up to date
+        self._keys_cache = self._all_keys()
+        return len(self._keys_cache)
 
     def __delitem__(self, key):
         """Remove key."""
@@ -444,15 +542,13 @@ class GCSProvider(StorageProvider):
             blob.delete()
         except self.missing_exceptions:
             raise KeyError(key)
+        if self._keys_cache is not None:
+            self._keys_cache.discard(key)
 
     def __contains__(self, key):
         """Checks if key exists in mapping."""
-        from google.cloud import storage  # type: ignore
-
-        stats = storage.Blob(
-            bucket=self.client_bucket, name=self._get_path_from_key(key)
-        ).exists(self.client_bucket.client)
-        return stats
+        # always asks the bucket, objects may have been written or deleted outside of this provider
+        return self.client_bucket.blob(self._get_path_from_key(key)).exists()
 
     def __getstate__(self):
         return (
@@ -482,7 +578,7 @@ class GCSProvider(StorageProvider):
             bucket = split_root[0]
             key = split_root[1] if len(split_root) > 1 else ""
 
-            client_bucket = self.client.get_bucket(bucket)
+            client_bucket = self.client.bucket(bucket)
         else:
             client_bucket = self.client_bucket
 
@@ -518,14 +614,45 @@ class GCSProvider(StorageProvider):
         bucket = split_root[0]
         path = split_root[1] if len(split_root) > 1 else ""
 
-        client_bucket = self.client.get_bucket(bucket)
+        client_bucket = self.client.bucket(bucket)
 
         try:
-            blob = client_bucket.get_blob(path)
+            blob = client_bucket.blob(path)
             return blob.download_as_bytes(retry=self.retry)
         except self.missing_exceptions:
             raise KeyError(path)
 
+    def set_items(self, items: dict, max_workers: int = _MAX_UPLOAD_WORKERS):
+        """Uploads several values concurrently, the first error encountered is raised after all uploads finish."""
+        self.check_readonly()
+        if not items:
+            return
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+            uploads = [
+                executor.submit(self.__setitem__, key, value)
+                for key, value in items.items()
+            ]
+        for upload in uploads:
+            upload.result()
+
+    def get_items(self, keys):
+        with ThreadPoolExecutor() as executor:
+            future_to_key = {
+                executor.submit(self.__getitem__, key): key for key in keys
+            }
+
+            for future in futures.as_completed(future_to_key):
+                key = future_to_key[future]
+                exception = future.exception()
+
+                if not exception:
+                    yield key, future.result()
+                elif isinstance(exception, KeyError):
+                    # missing keys are reported like in StorageProvider.get_items, any other error is raised
+                    yield key, exception
+                else:
+                    raise exception
+
     def get_creds(self):
         d = self.scoped_credentials.get_token_info()
         d["expiration"] = self.expiration or ""
@@ -6,7 +6,13 @@ from deeplake.tests.storage_fixtures import (
     enabled_persistent_storages,
 )
 from deeplake.tests.cache_fixtures import enabled_cache_chains
-from deeplake.core.storage.gcs import GCloudCredentials
+from deeplake.core.storage.gcs import (
+    GCloudCredentials,
+    GCSProvider,
+    _CLIENT_CACHE,
+    _MAX_CACHED_CLIENTS,
+    _MAX_POOL_CONNECTIONS,
+)
 from deeplake.core.storage.google_drive import GDriveProvider
 from deeplake.core.storage.azure import AzureProvider
 from deeplake.util.exceptions import GCSDefaultCredsNotFoundError
@@ -172,6 +178,98 @@ def test_gcs_tokens(request):
         gcreds = GCloudCredentials(token="browser")
 
 
+def test_gcs_shared_client(gcs_anon_storage):
+    from google.auth.credentials import AnonymousCredentials  # type: ignore
+
+    token = gcs_anon_storage.token
+    other = GCSProvider("gcs://bucket/path_2", token=token)
+    assert other.client is gcs_anon_storage.client
+    assert gcs_anon_storage.subdir("sub").client is gcs_anon_storage.client
+
+    # a different token gets its own client
+    assert (
+        GCSProvider("gcs://bucket/path", token=AnonymousCredentials()).client
+        is not gcs_anon_storage.client
+    )
+
+    # only the most recently used clients stay cached
+    for _ in range(_MAX_CACHED_CLIENTS):
+        GCSProvider("gcs://bucket/path", token=AnonymousCredentials())
+    assert len(_CLIENT_CACHE) <= _MAX_CACHED_CLIENTS
+    assert (
+        GCSProvider("gcs://bucket/path", token=token).client
+        is not gcs_anon_storage.client
+    )
+
+
+def test_gcs_connection_pool(gcs_anon_storage):
+    session = gcs_anon_storage.client._http
+    adapter = session.get_adapter("https://storage.googleapis.com")
+    assert adapter.poolmanager.connection_pool_kw["maxsize"] == _MAX_POOL_CONNECTIONS
+
+
+def test_gcs_get_items_errors(gcs_anon_storage, monkeypatch):
+    def getitem(key):
+        if key == "missing":
+            raise KeyError(key)
+        if key == "broken":
+            raise ValueError(key)
+        return key.encode()
+
+    monkeypatch.setattr(gcs_anon_storage, "__getitem__", getitem)
+    items = dict(gcs_anon_storage.get_items(["a", "b", "missing"]))
+    assert items["a"] == b"a" and items["b"] == b"b"
+    assert isinstance(items["missing"], KeyError)
+    with pytest.raises(ValueError):
+        dict(gcs_anon_storage.get_items(["a", "broken"]))
+
+
+def test_gcs_get_items(gcs_storage):
+    gcs_storage[f"{KEY}_1"] = b"hello"
+    gcs_storage[f"{KEY}_2"] = b"world"
+    items = dict(gcs_storage.get_items([f"{KEY}_1", f"{KEY}_2", f"{KEY}_3"]))
+    assert items[f"{KEY}_1"] == b"hello"
+    assert items[f"{KEY}_2"] == b"world"
+    assert isinstance(items[f"{KEY}_3"], KeyError)
+
+
+def test_gcs_set_items(gcs_storage):
+    items = {f"{KEY}_{i}": f"value {i}".encode() for i in range(50)}
+    gcs_storage.set_items(items)
+    assert dict(gcs_storage.get_items(list(items))) == items
+    for key in items:
+        del gcs_storage[key]
+
+
+def test_gcs_contains_other_writers(gcs_storage):
+    other = GCSProvider(gcs_storage.root, token=gcs_storage.token)
+    assert KEY not in gcs_storage
+
+    # membership must reflect writes and deletes made through other providers
+    other[KEY] = b"hello world"
+    assert KEY in gcs_storage
+    del other[KEY]
+    assert KEY not in gcs_storage
+
+
+def test_gcs_keys_other_writers(gcs_storage):
+    other = GCSProvider(gcs_storage.root, token=gcs_storage.token)
+    gcs_storage[f"{KEY}_1"] = b"hello"
+    assert len(gcs_storage) == 1
+    assert list(gcs_storage) == [f"{KEY}_1"]
+
+    # listings must reflect writes and deletes made through other providers
+    other[f"{KEY}_2"] = b"world"
+    assert len(gcs_storage) == 2
+    assert set(gcs_storage) == {f"{KEY}_1", f"{KEY}_2"}
+    assert gcs_storage._all_keys() == {f"{KEY}_1", f"{KEY}_2"}
+    del other[f"{KEY}_1"]
+    assert set(gcs_storage) == {f"{KEY}_2"}
+    assert len(gcs_storage) == 1
+    del other[f"{KEY}_2"]
+    assert set(gcs_storage) == set()
+
+
 def test_gdrive_from_token(request, gdrive_path, gdrive_creds):
     if not is_opt_true(request, GDRIVE_OPT):
         pytest.skip(f"{GDRIVE_OPT} flag not set")
@@ -816,9 +816,20 @@ class Tensor:
             )
 
     def __iter__(self):
+        index = self.index
+        if isinstance(index.values[0], list):
+            for i in range(len(self)):
+                yield self.__getitem__(i, is_iteration=False)
+            return
+        # resolved once for the whole loop instead of going through `__getitem__` per element
+        key, dataset, chunk_engine = self.key, self.dataset, self.chunk_engine
         for i in range(len(self)):
-            yield self.__getitem__(
-                i, is_iteration=not isinstance(self.index.values[0], list)
+            yield Tensor(
+                key,
+                dataset,
+                index=index[i],
+                is_iteration=True,
+                chunk_engine=chunk_engine,
             )
 
     @property
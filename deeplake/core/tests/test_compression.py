@@ -14,6 +14,7 @@ from deeplake.core.compression import (
     compress_multiple,
     decompress_multiple,
     verify_compressed_file,
+    compress_bytes,
     decompress_bytes,
 )
 from deeplake.compression import (
@@ -148,6 +149,15 @@ def test_lz4_empty():
     assert decompress_bytes(b"", "lz4") == b""
 
 
+def test_lz4_return_bytearray():
+    inp = np.random.random((100, 100)).tobytes()
+    for compressed in (compress_bytes(inp, "lz4"), lz4.frame.compress(inp)):
+        decompressed = decompress_bytes(compressed, "lz4", return_bytearray=True)
+        assert isinstance(decompressed, bytearray)
+        assert decompressed == inp
+    assert decompress_bytes(b"", "lz4", return_bytearray=True) == bytearray()
+
+
 @pytest.mark.skipif(
     os.name == "nt" and sys.version_info < (3, 7), reason="requires python 3.7 or above"
 )
@@ -38,6 +38,17 @@ def test_chunk_serialize():
     assert b"".join(data) == bytes(data2)
 
 
+def test_chunk_serialize_single_buffer():
+    version = deeplake.__version__
+    shape_info = np.ones((3, 2), dtype=ENCODING_DTYPE)
+    byte_positions = np.ones((2, 3), dtype=ENCODING_DTYPE)
+    data = bytearray(b"abc" * 100)
+
+    expected = serialize_chunk(version, shape_info, byte_positions, [data])
+    for buffer in (data, bytes(data), memoryview(data)):
+        assert serialize_chunk(version, shape_info, byte_positions, buffer) == expected
+
+
 def test_chunkids_serialize():
     version = deeplake.__version__
     arr = np.cast[ENCODING_DTYPE](np.random.randint(100, size=(100, 2)))
@@ -1,3 +1,5 @@
+from functools import reduce
+from operator import mul
 from typing import Optional, Tuple, Union
 import numpy as np
 
@@ -111,7 +113,7 @@ class SampleTiles:
         )
         return get_tile_shape(
             self.sample_shape,
-            np.prod(np.array(self.sample_shape, dtype=np.uint64))  # type: ignore
+            reduce(mul, map(int, self.sample_shape), 1)  # type: ignore
             * np.dtype(dtype).itemsize
             * get_compression_ratio(compression),
             chunk_size,
@@ -46,16 +46,20 @@ def fn1(sample_in, samples_out, mul=1, copy=1):
 
 @deeplake.compute
 def fn2(sample_in, samples_out, mul=1, copy=1):
+    image = sample_in.image.numpy()
+    label = sample_in.label.numpy()
     for _ in range(copy):
-        samples_out.image.append(sample_in.image.numpy() * mul)
-        samples_out.label.append(sample_in.label.numpy() * mul)
+        samples_out.image.append(image * mul)
+        samples_out.label.append(label * mul)
 
 
 @deeplake.compute
 def fn3(sample_in, samples_out, mul=1, copy=1):
     for _ in range(copy):
-        samples_out.image.append(np.ones((1310, 2087)) * sample_in * mul)
-        samples_out.label.append(np.ones((13,)) * sample_in * mul)
+        samples_out.image.append(
+            np.full((1310, 2087), sample_in * mul, dtype=np.float64)
+        )
+        samples_out.label.append(np.full((13,), sample_in * mul, dtype=np.float64))
 
 
 @deeplake.compute
@@ -68,18 +72,22 @@ def fn4(sample_in, samples_out):
 
 @deeplake.compute
 def fn5(sample_in, samples_out, mul=1, copy=1):
+    image = sample_in.z.y.x.image.numpy()
+    label = sample_in.z.y.x.label.numpy()
     for _ in range(copy):
-        samples_out.x["y"].z.image.append(sample_in.z.y.x.image.numpy() * mul)
-        samples_out.x.y.z["label"].append(sample_in.z.y.x.label.numpy() * mul)
+        samples_out.x["y"].z.image.append(image * mul)
+        samples_out.x.y.z["label"].append(label * mul)
 
 
 @deeplake.compute
 def fn6(sample_in, samples_out, mul=1, copy=1):
+    image = sample_in.image.numpy()
+    label = sample_in.label.numpy()
     for _ in range(copy):
         samples_out.append(
             {
-                "image": sample_in.image.numpy() * mul,
-                "label": sample_in.label.numpy() * mul,
+                "image": image * mul,
+                "label": label * mul,
             }
         )
 
@@ -98,7 +106,7 @@ def crop_image(sample_in, samples_out, copy=1):
 @deeplake.compute
 def filter_tr(sample_in, sample_out):
     if sample_in % 2 == 0:
-        sample_out.image.append(sample_in * np.ones((100, 100)))
+        sample_out.image.append(np.full((100, 100), float(sample_in)))
 
 
 @deeplake.compute
@@ -109,10 +117,10 @@ def populate_cc_bug(sample_in, samples_out):
 
 @deeplake.compute
 def inplace_transform(sample_in, samples_out):
-    samples_out.img.append(2 * sample_in.img.numpy())
-    samples_out.img.append(3 * sample_in.img.numpy())
-    samples_out.label.append(2 * sample_in.label.numpy())
-    samples_out.label.append(3 * sample_in.label.numpy())
+    img = sample_in.img.numpy()
+    label = sample_in.label.numpy()
+    samples_out.img.extend(np.stack([2 * img, 3 * img]))
+    samples_out.label.extend(np.stack([2 * label, 3 * label]))
 
 
 @deeplake.compute
@@ -154,11 +162,18 @@ def fn_aggregate(samples_in, samples_out, key, values):
     values.append(samples_in[key].numpy().mean())
 
 
+def assert_constant(arr, value, shape):
+    """Asserts that ``arr`` has the given shape and every element equals ``value``."""
+    assert arr.shape == shape
+    assert arr.dtype.kind in "fiu"
+    if arr.size and not arr.min() == arr.max() == value:
+        # full comparison only to report the mismatching elements
+        np.testing.assert_array_equal(arr, np.full(shape, value, dtype=np.float64))
+
+
 def check_target_array(ds, index, target):
-    np.testing.assert_array_equal(
-        ds.img[index].numpy(), target * np.ones((200, 200, 3))
-    )
-    np.testing.assert_array_equal(ds.label[index].numpy(), target * np.ones((1,)))
+    assert_constant(ds.img[index].numpy(), target, (200, 200, 3))
+    assert_constant(ds.label[index].numpy(), target, (1,))
 
 
 def retrieve_objects_from_memory(object_type=deeplake.core.sample.Sample):
@@ -177,7 +192,7 @@ def retrieve_objects_from_memory(object_type=deeplake.core.sample.Sample):
 @all_schedulers
 @pytest.mark.parametrize(
     "ds",
-    ["memory_ds", "local_ds", "s3_ds"],
+    ["memory_ds", "local_ds", "s3_ds", "gcs_ds"],
     indirect=True,
 )
 def test_single_transform_deeplake_dataset(ds, scheduler):
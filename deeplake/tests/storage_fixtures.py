@@ -76,6 +76,20 @@ def gcs_storage(gcs_path):
     return GCSProvider(gcs_path)
 
 
+@pytest.fixture
+def gcs_anon_storage(monkeypatch):
+    from google.auth.credentials import AnonymousCredentials  # type: ignore
+    from deeplake.core.storage import gcs
+
+    # anonymous clients make no requests until they are used, they only need a project
+    monkeypatch.setenv("GOOGLE_CLOUD_PROJECT", "test-project")
+    yield GCSProvider("gcs://bucket/path", token=AnonymousCredentials())
+
+    # clients created by the test are not shared with later tests
+    with gcs._CLIENT_CACHE_LOCK:
+        gcs._CLIENT_CACHE.clear()
+
+
 @pytest.fixture
 def azure_storage(azure_path):
     return AzureProvider(azure_path)